@@ -0,0 +1,39 @@
+# 📁 새로 생성된 파일: alembic/versions/002_users_nickname_index.py
+# users.nickname 유니크 인덱스 추가
+
+"""Add unique index on users.nickname
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    
+    # users.username 은 001에서 이미 유니크 인덱스(ix_users_username)가 생성됨
+    # CONCURRENTLY 는 트랜잭션 밖에서 실행해야 함
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_nickname', 'users', ['nickname'],
+            unique=True, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """마이그레이션 롤백 (다운그레이드)"""
+    
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_nickname', table_name='users',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,46 @@
+# 📁 새로 생성된 파일: alembic/versions/003_users_nickname_trgm_index.py
+# users.nickname 트라이그램 검색 인덱스 추가
+
+"""Add pg_trgm GIN index on users.nickname
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    
+    # 트라이그램 연산자 클래스(gin_trgm_ops) 제공 확장
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    # 닉네임 부분 일치(ILIKE '%...%') 검색용 GIN 인덱스
+    # CONCURRENTLY 는 트랜잭션 밖에서 실행해야 함 (인덱스 생성 중 users 쓰기 차단 방지)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_nickname_trgm', 'users', ['nickname'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'nickname': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """마이그레이션 롤백 (다운그레이드)"""
+    
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_nickname_trgm', table_name='users',
+            postgresql_concurrently=True
+        )
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 삭제하지 않음
@@ -0,0 +1,65 @@
+# 📁 새로 생성된 파일: alembic/versions/004_users_lower_nickname_and_list_index.py
+# users.nickname 대소문자 무시 유니크 인덱스 및 목록 조회용 커버링 인덱스 추가
+
+"""Make users.nickname unique case-insensitively and add covering list index
+
+주의: 대소문자만 다른 닉네임 행("Alice"/"alice")이 이미 있으면 유니크 인덱스 생성이
+실패하고 INVALID 인덱스가 남음. 적용 전에 아래 쿼리로 확인 후 정리해야 함.
+    SELECT lower(nickname), count(*) FROM users GROUP BY 1 HAVING count(*) > 1;
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """마이그레이션 적용 (업그레이드)"""
+    
+    # CONCURRENTLY 는 트랜잭션 밖에서 실행해야 함
+    with op.get_context().autocommit_block():
+        # 닉네임 대소문자 무시 유니크 인덱스
+        op.create_index(
+            'ix_users_nickname_lower', 'users', [sa.text('lower(nickname)')],
+            unique=True, postgresql_concurrently=True
+        )
+        
+        # 002의 대소문자 구분 유니크 인덱스는 위 인덱스에 포함되므로 삭제
+        op.drop_index(
+            'ix_users_nickname', table_name='users',
+            postgresql_concurrently=True
+        )
+        
+        # 사용자 목록(created_at 역순) 조회를 인덱스만으로 처리하기 위한 커버링 인덱스
+        op.create_index(
+            'ix_users_list_cover', 'users', ['created_at'],
+            unique=False, postgresql_concurrently=True,
+            postgresql_include=['id', 'username', 'nickname', 'updated_at']
+        )
+
+
+def downgrade() -> None:
+    """마이그레이션 롤백 (다운그레이드)"""
+    
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_list_cover', table_name='users',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_users_nickname', 'users', ['nickname'],
+            unique=True, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_users_nickname_lower', table_name='users',
+            postgresql_concurrently=True
+        )
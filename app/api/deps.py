@@ -1,15 +1,20 @@
 # 📁 새로 생성된 파일: app/api/deps.py
 # API 의존성 함수들
 
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import Generator, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
-from app.database.base import get_async_session
+from app.database.base import AsyncSessionLocal
 from app.core.config import settings
+from app.core import auth_cache
 from app.crud.user import user_crud
 from app.models.user import User
+import asyncio
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,65 +27,144 @@ async def get_db() -> AsyncSession:
     """
     데이터베이스 세션 의존성
     - FastAPI 엔드포인트에서 사용
+    - 요청당 하나의 세션 (FastAPI 의존성 캐시로 여러 의존성이 같은 세션을 공유)
+    - 커넥션은 세션이 첫 쿼리를 실행할 때 엔진 풀에서 가져옴
     """
-    async for session in get_async_session():
-        yield session
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
 
 
-async def get_current_user_optional(
-    db: AsyncSession = Depends(get_db),
+# JWT 디코딩 설정 (모듈 로드 시 한 번만 계산)
+# - 키/알고리즘 목록/옵션을 요청마다 새로 만들지 않음
+# - sub, exp 클레임 필수
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALGS = [settings.JWT_ALGORITHM]
+_JWT_OPTS = {"require_sub": True, "require_exp": True, "verify_aud": False}
+
+# JWT 서명 검증(CPU 작업)을 이벤트 루프 밖에서 실행하기 위한 전용 스레드 풀
+_JWT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jwt-decode")
+
+
+async def _decode_and_cache(token: str) -> dict:
+    """
+    JWT 토큰 디코딩 (단일 디코딩 지점)
+    - auth_cache에 검증 결과가 있으면 디코딩 생략
+    - 서명 검증은 전용 스레드 풀에서 실행
+    
+    Args:
+        token: JWT 토큰
+        
+    Returns:
+        토큰 클레임 (캐시 히트/미스와 관계없이 전체 페이로드)
+        
+    Raises:
+        JWTError: 토큰 검증 실패
+    """
+    cache_key = auth_cache.token_key(token)
+    cached = await auth_cache.get_cached_claims(cache_key)
+    if cached is not None:
+        # 캐시 히트: JWT 디코딩 생략
+        return cached
+    
+    loop = asyncio.get_running_loop()
+    payload = await loop.run_in_executor(
+        _JWT_POOL,
+        functools.partial(
+            jwt.decode,
+            token,
+            _JWT_KEY,
+            algorithms=_JWT_ALGS,
+            options=_JWT_OPTS
+        )
+    )
+    
+    if payload.get("sub"):
+        await auth_cache.cache_claims(cache_key, payload)
+    return payload
+
+
+async def _decoded_claims(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> Optional[User]:
+) -> Optional[dict]:
     """
-    현재 사용자 조회 (선택적)
-    - 토큰이 없어도 None 반환 (에러 발생 안함)
+    JWT 토큰 디코딩 (요청당 1회)
+    - FastAPI 의존성 캐시로 같은 요청 안에서는 한 번만 실행됨
     
     Args:
-        db: 데이터베이스 세션
         credentials: JWT 토큰 인증 정보
         
     Returns:
-        현재 사용자 또는 None
+        토큰 클레임 ({"sub", "exp"} 포함) 또는 None
     """
     if not credentials:
         return None
     
     try:
-        # JWT 토큰 디코딩
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        
-        # Cognito User ID 추출
-        cognito_user_id: str = payload.get("sub")
-        if not cognito_user_id:
-            return None
-        
-        # 사용자 조회
-        user = await user_crud.get_by_username(db, username=cognito_user_id)
-        return user
-        
+        payload = await _decode_and_cache(credentials.credentials)
     except JWTError as e:
         logger.warning(f"JWT 토큰 검증 실패: {e}")
         return None
+    
+    # Cognito User ID 확인
+    if not payload.get("sub"):
+        return None
+    
+    return payload
+
+
+async def _user_from_claims(
+    db: AsyncSession = Depends(get_db),
+    claims: Optional[dict] = Depends(_decoded_claims)
+) -> Optional[User]:
+    """
+    토큰 클레임으로 사용자 조회 (요청당 1회)
+    
+    Args:
+        db: 데이터베이스 세션
+        claims: 디코딩된 토큰 클레임
+        
+    Returns:
+        사용자 또는 None
+    """
+    if not claims:
+        return None
+    
+    try:
+        return await user_crud.get_by_username(db, username=claims["sub"])
     except Exception as e:
         logger.error(f"사용자 인증 중 오류: {e}")
         return None
 
 
+async def get_current_user_optional(
+    user: Optional[User] = Depends(_user_from_claims)
+) -> Optional[User]:
+    """
+    현재 사용자 조회 (선택적)
+    - 토큰이 없어도 None 반환 (에러 발생 안함)
+    
+    Args:
+        user: 토큰으로 조회한 사용자
+        
+    Returns:
+        현재 사용자 또는 None
+    """
+    return user
+
+
 async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user: Optional[User] = Depends(_user_from_claims)
 ) -> User:
     """
     현재 사용자 조회 (필수)
     - 토큰이 없거나 유효하지 않으면 401 에러 발생
     
     Args:
-        db: 데이터베이스 세션
-        credentials: JWT 토큰 인증 정보
+        user: 토큰으로 조회한 사용자
         
     Returns:
         현재 사용자
@@ -88,40 +172,14 @@ async def get_current_user(
     Raises:
         HTTPException: 인증 실패 시 401 에러
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증 정보가 유효하지 않습니다",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        if not credentials:
-            raise credentials_exception
-
-        # JWT 토큰 디코딩
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 정보가 유효하지 않습니다",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        
-        # Cognito User ID 추출
-        cognito_user_id: str = payload.get("sub")
-        if not cognito_user_id:
-            raise credentials_exception
-        
-        # 사용자 조회
-        user = await user_crud.get_by_username(db, username=cognito_user_id)
-        if not user:
-            raise credentials_exception
-        
-        return user
-        
-    except JWTError:
-        raise credentials_exception
-    except Exception as e:
-        logger.error(f"사용자 인증 중 오류: {e}")
-        raise credentials_exception
+    
+    return user
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -145,10 +203,13 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
-def verify_cognito_token(token: str) -> dict:
+async def verify_cognito_token(token: str) -> dict:
     """
     AWS Cognito JWT 토큰 검증
     - 실제 운영 환경에서는 Cognito 공개 키로 검증해야 함
+    - 인증 의존성과 같은 디코더/캐시를 사용 (중복 디코딩 방지)
+    - 공유 디코더가 캐시/스레드 풀을 await 하므로 async 함수
+    - 현재 코드 내 호출처 없음 (외부 연동용으로 유지)
     
     Args:
         token: JWT 토큰
@@ -162,12 +223,7 @@ def verify_cognito_token(token: str) -> dict:
     try:
         # 개발 환경에서는 간단한 JWT 검증
         # 운영 환경에서는 Cognito 공개 키 사용 필요
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        return payload
+        return await _decode_and_cache(token)
     except JWTError as e:
         logger.error(f"Cognito 토큰 검증 실패: {e}")
         raise
@@ -210,32 +266,27 @@ async def check_item_ownership(
     return True
 
 
-class CommonQueryParams:
+class CommonQuery(BaseModel):
     """
-    공통 쿼리 파라미터 클래스
+    공통 쿼리 파라미터 모델
     - 페이지네이션 및 정렬 파라미터
     """
-    def __init__(
-        self,
-        skip: int = 0,
-        limit: int = 20,
-        sort_by: str = "created_at",
-        sort_order: str = "desc"
-    ):
-        self.skip = skip
-        self.limit = min(limit, 100)  # 최대 100개로 제한
-        self.sort_by = sort_by
-        self.sort_order = sort_order
+    skip: int = Field(0, ge=0)
+    limit: int = Field(20, ge=1, le=100)  # 최대 100개로 제한
+    sort_by: str = "created_at"
+    sort_order: Literal["asc", "desc"] = "desc"
 
 
 def common_parameters(
-    skip: int = 0,
-    limit: int = 20,
-    sort_by: str = "created_at",
-    sort_order: str = "desc"
-) -> CommonQueryParams:
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    limit: int = Query(20, ge=1, le=100, description="최대 조회 레코드 수 (최대 100)"),
+    sort_by: str = Query("created_at", description="정렬 기준 필드"),
+    sort_order: Literal["asc", "desc"] = Query("desc", description="정렬 순서")
+) -> CommonQuery:
     """
     공통 쿼리 파라미터 의존성
+    - 범위 검증은 FastAPI 쿼리 검증 단계에서 처리 (잘못된 값은 422 응답)
+    - 이미 검증된 값이므로 모델 재검증 없이 생성
     
     Args:
         skip: 건너뛸 레코드 수
@@ -246,4 +297,6 @@ def common_parameters(
     Returns:
         공통 쿼리 파라미터 객체
     """
-    return CommonQueryParams(skip, limit, sort_by, sort_order)
+    return CommonQuery.model_construct(
+        skip=skip, limit=limit, sort_by=sort_by, sort_order=sort_order
+    )
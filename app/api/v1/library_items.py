@@ -3,15 +3,16 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import (
     get_db, get_current_user, get_current_active_user, get_current_user_optional,
-    common_parameters, CommonQueryParams, check_item_ownership
+    common_parameters, CommonQuery, check_item_ownership
 )
 from app.crud.library_item import library_item_crud
 from app.crud.user import user_crud
 from app.schemas.library_item import (
-    LibraryItemCreate, LibraryItemUpdate, LibraryItemResponse,
+    LibraryItemCreate, LibraryItemUpdate, LibraryItemResponse, LibraryItemResponseList,
     ItemType, VisibilityType, PresignedUrlRequest, PresignedUrlResponse
 )
 from app.schemas.common import SuccessResponse, ErrorResponse, PaginatedResponse, PaginationInfo
@@ -66,7 +67,7 @@ async def create_library_item(
         logger.info(f"새 라이브러리 아이템 생성: {item.name} (사용자: {username})")
         
         return SuccessResponse(
-            data=LibraryItemResponse.from_orm(item),
+            data=LibraryItemResponse.model_validate(item),
             message="라이브러리 아이템이 성공적으로 생성되었습니다"
         )
         
@@ -87,7 +88,7 @@ async def create_library_item(
 async def get_my_library_items(
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
-    commons: CommonQueryParams = Depends(common_parameters),
+    commons: CommonQuery = Depends(common_parameters),
     item_type: Optional[ItemType] = Query(None, description="아이템 타입 필터"),
     search: Optional[str] = Query(None, description="검색 키워드"),
     include_deleted: bool = Query(False, description="삭제된 아이템 포함 여부")
@@ -139,7 +140,7 @@ async def get_my_library_items(
         )
         
         return PaginatedResponse(
-            data=[LibraryItemResponse.from_orm(item) for item in items],
+            data=LibraryItemResponseList.validate_python(items, from_attributes=True),
             pagination=pagination_info,
             message="라이브러리 아이템 목록 조회 성공"
         )
@@ -160,7 +161,7 @@ async def get_my_library_items(
 )
 async def get_public_library_items(
     db: AsyncSession = Depends(get_db),
-    commons: CommonQueryParams = Depends(common_parameters),
+    commons: CommonQuery = Depends(common_parameters),
     item_type: Optional[ItemType] = Query(None, description="아이템 타입 필터")
 ) -> PaginatedResponse[LibraryItemResponse]:
     """
@@ -189,7 +190,7 @@ async def get_public_library_items(
         )
         
         return PaginatedResponse(
-            data=[LibraryItemResponse.from_orm(item) for item in items],
+            data=LibraryItemResponseList.validate_python(items, from_attributes=True),
             pagination=pagination_info,
             message="공개 라이브러리 아이템 목록 조회 성공"
         )
@@ -237,7 +238,7 @@ async def get_library_item(
             )
         
         return SuccessResponse(
-            data=LibraryItemResponse.from_orm(item),
+            data=LibraryItemResponse.model_validate(item),
             message="라이브러리 아이템 조회 성공"
         )
         
@@ -284,7 +285,7 @@ async def update_library_item(
         logger.info(f"라이브러리 아이템 수정: {updated_item.name} (사용자: {username})")
         
         return SuccessResponse(
-            data=LibraryItemResponse.from_orm(updated_item),
+            data=LibraryItemResponse.model_validate(updated_item),
             message="라이브러리 아이템이 성공적으로 수정되었습니다"
         )
         
@@ -377,7 +378,7 @@ async def restore_library_item(
         logger.info(f"라이브러리 아이템 복원: {restored_item.name} (사용자: {username})")
         
         return SuccessResponse(
-            data=LibraryItemResponse.from_orm(restored_item),
+            data=LibraryItemResponse.model_validate(restored_item),
             message="라이브러리 아이템이 성공적으로 복원되었습니다"
         )
         
@@ -478,16 +479,19 @@ async def generate_presigned_url(
         
         logger.info(f"Presigned URL 생성: {request.filename} (사용자: {username})")
         
-        return SuccessResponse(
-            data=PresignedUrlResponse(
-                upload_url=upload_info["upload_url"],
-                s3_key=upload_info["s3_key"],
-                expires_in=upload_info["expires_in"],
-                fields=upload_info.get("fields", {}),
-                file_info=file_info
-            ),
-            message="업로드 URL이 성공적으로 생성되었습니다"
-        )
+        # 단순 타입 딕셔너리이므로 응답 모델 검증 없이 바로 orjson으로 직렬화
+        # (response_model은 OpenAPI 문서용으로 유지)
+        return ORJSONResponse({
+            "success": True,
+            "message": "업로드 URL이 성공적으로 생성되었습니다",
+            "data": {
+                "upload_url": upload_info["upload_url"],
+                "s3_key": upload_info["s3_key"],
+                "expires_in": upload_info["expires_in"],
+                "fields": upload_info.get("fields", {}),
+                "file_info": file_info
+            }
+        })
         
     except HTTPException:
         raise
@@ -3,12 +3,13 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.base import get_async_session
 from app.crud.user import user_crud
 from app.crud.library_item import library_item_crud
-from app.schemas.user import UserCreate, UserResponse
-from app.schemas.library_item import LibraryItemCreate, LibraryItemResponse
+from app.schemas.user import UserCreate, UserResponse, user_to_response
+from app.schemas.library_item import LibraryItemCreate, LibraryItemResponse, LibraryItemResponseList
 from app.schemas.common import SuccessResponse
 import logging
 
@@ -38,7 +39,7 @@ async def create_test_user(
         logger.info(f"테스트 사용자 생성: {user.username} ({user.nickname})")
         
         return SuccessResponse(
-            data=UserResponse.from_orm(user),
+            data=user_to_response(user),
             message="테스트 사용자가 성공적으로 생성되었습니다"
         )
         
@@ -71,10 +72,12 @@ async def get_all_users(
     try:
         users = await user_crud.get_multi(db, skip=0, limit=100)
         
-        return SuccessResponse(
-            data=[UserResponse.from_orm(user) for user in users],
-            message=f"총 {len(users)}명의 사용자를 조회했습니다"
-        )
+        # 원본 타입 딕셔너리를 orjson으로 바로 직렬화
+        return ORJSONResponse({
+            "success": True,
+            "message": f"총 {len(users)}명의 사용자를 조회했습니다",
+            "data": [user.to_dict_raw() for user in users]
+        })
         
     except Exception as e:
         logger.error(f"사용자 목록 조회 중 오류: {e}")
@@ -116,7 +119,7 @@ async def create_test_library_item(
         logger.info(f"테스트 아이템 생성: {item.name} (사용자: {user.username})")
         
         return SuccessResponse(
-            data=LibraryItemResponse.from_orm(item),
+            data=LibraryItemResponse.model_validate(item),
             message="테스트 아이템이 성공적으로 생성되었습니다"
         )
         
@@ -158,7 +161,7 @@ async def get_user_library_items(
         )
         
         return SuccessResponse(
-            data=[LibraryItemResponse.from_orm(item) for item in items],
+            data=LibraryItemResponseList.validate_python(items, from_attributes=True),
             message=f"사용자 {user.nickname}의 아이템 {len(items)}개를 조회했습니다"
         )
         
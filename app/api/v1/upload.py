@@ -3,6 +3,7 @@
 
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, get_current_active_user, get_current_user_optional
 from app.core.config import settings
@@ -11,6 +12,7 @@ from app.services.file_service import file_service
 from app.schemas.library_item import PresignedUrlRequest, PresignedUrlResponse
 from app.schemas.common import SuccessResponse
 from app.models.user import User
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -68,16 +70,19 @@ async def generate_real_presigned_url(
         
         logger.info(f"실제 S3 Presigned URL 생성: {request.filename} (사용자: {username})")
         
-        return SuccessResponse(
-            data=PresignedUrlResponse(
-                upload_url=upload_info["upload_url"],
-                s3_key=upload_info["s3_key"],
-                expires_in=upload_info["expires_in"],
-                fields=upload_info.get("fields", {}),
-                file_info=file_info
-            ),
-            message="실제 S3 업로드 URL이 성공적으로 생성되었습니다"
-        )
+        # 단순 타입 딕셔너리이므로 응답 모델 검증 없이 바로 orjson으로 직렬화
+        # (response_model은 OpenAPI 문서용으로 유지)
+        return ORJSONResponse({
+            "success": True,
+            "message": "실제 S3 업로드 URL이 성공적으로 생성되었습니다",
+            "data": {
+                "upload_url": upload_info["upload_url"],
+                "s3_key": upload_info["s3_key"],
+                "expires_in": upload_info["expires_in"],
+                "fields": upload_info.get("fields", {}),
+                "file_info": file_info
+            }
+        })
         
     except HTTPException:
         raise
@@ -125,18 +130,23 @@ async def generate_download_url(
             )
         
         # S3 다운로드 URL 생성
-        download_url = await s3_service.generate_presigned_download_url(
+        download_coro = s3_service.generate_presigned_download_url(
             s3_key=item.s3_key,
             expires_in=3600  # 1시간
         )
         
-        # 썸네일 URL도 함께 생성 (있는 경우)
+        # 썸네일 URL도 함께 생성 (있는 경우 두 URL을 동시에 생성)
         thumbnail_url = None
         if item.s3_thumbnail_key:
-            thumbnail_url = await s3_service.generate_presigned_download_url(
-                s3_key=item.s3_thumbnail_key,
-                expires_in=3600
+            download_url, thumbnail_url = await asyncio.gather(
+                download_coro,
+                s3_service.generate_presigned_download_url(
+                    s3_key=item.s3_thumbnail_key,
+                    expires_in=3600
+                )
             )
+        else:
+            download_url = await download_coro
         
         logger.info(f"다운로드 URL 생성: {item.name} (사용자: {current_user.username})")
         
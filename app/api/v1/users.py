@@ -3,20 +3,26 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_db, get_current_user, get_current_active_user, common_parameters, CommonQueryParams
+from app.api.deps import get_db, get_current_user, get_current_active_user, common_parameters, CommonQuery
 from app.crud.user import user_crud
 from app.schemas.user import (
-    UserCreate, UserUpdate, UserResponse, UserListResponse, UserStatsResponse
+    UserCreate, UserUpdate, UserResponse, UserListResponse, UserStatsResponse,
+    UserResponseStruct, user_to_response
 )
 from app.schemas.common import SuccessResponse, ErrorResponse, PaginatedResponse, PaginationInfo
 from app.models.user import User
 import logging
+import msgspec
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 사용자 목록 응답 인코더 (재사용)
+_user_enc = msgspec.json.Encoder()
+
 
 @router.post(
     "/",
@@ -42,7 +48,7 @@ async def create_user(
         logger.info(f"새 사용자 생성: {user.username} ({user.nickname})")
         
         return SuccessResponse(
-            data=UserResponse.from_orm(user),
+            data=user_to_response(user),
             message="사용자가 성공적으로 생성되었습니다"
         )
         
@@ -73,7 +79,7 @@ async def get_current_user_info(
     현재 사용자 정보 조회 API
     """
     return SuccessResponse(
-        data=UserResponse.from_orm(current_user),
+        data=user_to_response(current_user),
         message="사용자 정보 조회 성공"
     )
 
@@ -108,7 +114,7 @@ async def update_current_user(
         logger.info(f"사용자 정보 수정: {updated_user.username}")
         
         return SuccessResponse(
-            data=UserResponse.from_orm(updated_user),
+            data=user_to_response(updated_user),
             message="사용자 정보가 성공적으로 수정되었습니다"
         )
         
@@ -189,7 +195,7 @@ async def get_user(
             )
         
         return SuccessResponse(
-            data=UserResponse.from_orm(user),
+            data=user_to_response(user),
             message="사용자 정보 조회 성공"
         )
         
@@ -211,7 +217,7 @@ async def get_user(
 )
 async def get_users(
     db: AsyncSession = Depends(get_db),
-    commons: CommonQueryParams = Depends(common_parameters),
+    commons: CommonQuery = Depends(common_parameters),
     search: Optional[str] = Query(None, description="검색 키워드 (닉네임)")
 ) -> PaginatedResponse[UserResponse]:
     """
@@ -244,10 +250,21 @@ async def get_users(
             has_prev=current_page > 1
         )
         
-        return PaginatedResponse(
-            data=[UserResponse.from_orm(user) for user in users],
-            pagination=pagination_info,
-            message="사용자 목록 조회 성공"
+        # 목록 응답은 Pydantic 모델 대신 msgspec 구조체로 바로 인코딩
+        structs = [
+            UserResponseStruct(
+                user.id, user.username, user.nickname, user.created_at, user.updated_at
+            )
+            for user in users
+        ]
+        return Response(
+            _user_enc.encode({
+                "success": True,
+                "message": "사용자 목록 조회 성공",
+                "data": structs,
+                "pagination": pagination_info.model_dump()
+            }),
+            media_type="application/json"
         )
         
     except Exception as e:
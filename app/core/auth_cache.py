@@ -0,0 +1,71 @@
+# 📁 새로 생성된 파일: app/core/auth_cache.py
+# JWT 검증 결과 캐시
+
+"""
+JWT 검증 결과 캐시
+- 동일한 토큰에 대한 반복 디코딩을 방지
+- 키는 토큰 원문의 SHA-256 다이제스트 (원문 토큰은 저장하지 않음)
+- 값은 검증된 클레임 전체 (캐시 히트/미스와 관계없이 같은 페이로드 반환)
+- 토큰 만료 시간(exp)이 지난 항목은 절대 반환하지 않음
+"""
+
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+import asyncio
+import hashlib
+import time
+
+# 캐시 설정
+AUTH_CACHE_MAXSIZE = 10000
+AUTH_CACHE_TTL = 5  # 초
+
+# 토큰 다이제스트 -> 검증된 토큰 클레임
+_cache: "TTLCache[bytes, Dict[str, Any]]" = TTLCache(
+    maxsize=AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL
+)
+_lock = asyncio.Lock()
+
+
+def token_key(token: str) -> bytes:
+    """토큰 원문으로부터 캐시 키(SHA-256 다이제스트) 생성"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+async def get_cached_claims(key: bytes) -> Optional[Dict[str, Any]]:
+    """
+    캐시된 토큰 클레임 조회
+
+    Args:
+        key: token_key()로 생성한 캐시 키
+
+    Returns:
+        토큰 클레임 사본 또는 None (캐시 미스 또는 만료된 토큰)
+    """
+    async with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+
+        # 캐시 TTL 내라도 토큰 자체가 만료되었으면 제거
+        if entry["exp"] <= time.time():
+            _cache.pop(key, None)
+            return None
+
+        # 호출 측 수정이 캐시에 반영되지 않도록 사본 반환
+        return dict(entry)
+
+
+async def cache_claims(key: bytes, claims: Dict[str, Any]) -> None:
+    """
+    검증된 토큰 클레임 저장
+    - 이미 만료된 토큰은 저장하지 않음
+
+    Args:
+        key: token_key()로 생성한 캐시 키
+        claims: 검증된 토큰 클레임 (exp 포함)
+    """
+    if claims["exp"] <= time.time():
+        return
+
+    async with _lock:
+        _cache[key] = dict(claims)
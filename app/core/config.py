@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     DB_NAME: str = "testdb"
     DB_USER: str = "tuser"
     DB_PASSWORD: str = "test123"
+    DB_ECHO: bool = False  # SQL 로그 출력 여부 (디버깅 시에만 켜기)
     
     # AWS Cognito 설정
     AWS_REGION: str = "ap-northeast-2"
@@ -79,18 +80,3 @@ class Settings(BaseSettings):
 
 # 전역 설정 인스턴스
 settings = Settings()
-
-# 개발 환경에서만 설정 정보 출력
-if settings.DEBUG:
-    print("🔧 애플리케이션 설정 로드 완료")
-    print(f"📊 데이터베이스: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
-    print(f"🌐 서버: {settings.HOST}:{settings.PORT}")
-    print(f"🔐 JWT 알고리즘: {settings.JWT_ALGORITHM}")
-    print(f"☁️ AWS 리전: {settings.AWS_REGION}")
-    print(f"🪣 S3 버킷: {settings.S3_BUCKET_NAME}")
-    
-    # AWS 키가 설정되었는지 확인
-    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-        print("✅ AWS 자격 증명 설정됨")
-    else:
-        print("⚠️ AWS 자격 증명이 설정되지 않음 - 개발 모드로 실행")
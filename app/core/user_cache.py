@@ -0,0 +1,93 @@
+# 📁 새로 생성된 파일: app/core/user_cache.py
+# 사용자 조회 결과 캐시
+
+"""
+사용자 조회 결과 캐시
+- 인증된 요청마다 발생하는 username 조회 SELECT를 줄이기 위한 캐시
+- 키는 Cognito User ID(username)
+- ORM 객체는 세션에 묶여 있으므로 컬럼 값(dict)만 저장
+- 존재하지 않는 username도 짧게 캐시하여 반복 조회로 인한 DB 부하 방지
+- 사용자 생성/수정 시 무효화
+"""
+
+from typing import Any, Dict, Optional
+from cachetools import TTLCache
+import asyncio
+
+# 캐시 설정
+USER_CACHE_MAXSIZE = 50000
+USER_CACHE_TTL = 60  # 초
+NEGATIVE_CACHE_TTL = 30  # 초
+
+# username -> 사용자 컬럼 값 딕셔너리
+_cache: "TTLCache[str, Dict[str, Any]]" = TTLCache(
+    maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL
+)
+# 존재하지 않는 username (값은 사용하지 않음)
+_missing: "TTLCache[str, bool]" = TTLCache(
+    maxsize=USER_CACHE_MAXSIZE, ttl=NEGATIVE_CACHE_TTL
+)
+_lock = asyncio.Lock()
+
+
+async def get_user_fields(username: str) -> Optional[Dict[str, Any]]:
+    """
+    캐시된 사용자 컬럼 값 조회
+
+    Args:
+        username: AWS Cognito User ID
+
+    Returns:
+        사용자 컬럼 값 딕셔너리 또는 None (캐시 미스)
+    """
+    async with _lock:
+        return _cache.get(username)
+
+
+async def cache_user_fields(username: str, fields: Dict[str, Any]) -> None:
+    """
+    사용자 컬럼 값 저장
+
+    Args:
+        username: AWS Cognito User ID
+        fields: 사용자 컬럼 값 딕셔너리
+    """
+    async with _lock:
+        _cache[username] = fields
+
+
+async def is_missing(username: str) -> bool:
+    """
+    존재하지 않는 사용자로 캐시되어 있는지 확인
+
+    Args:
+        username: AWS Cognito User ID
+
+    Returns:
+        최근 조회에서 사용자가 없었으면 True
+    """
+    async with _lock:
+        return username in _missing
+
+
+async def cache_missing(username: str) -> None:
+    """
+    존재하지 않는 사용자 기록
+
+    Args:
+        username: AWS Cognito User ID
+    """
+    async with _lock:
+        _missing[username] = True
+
+
+async def invalidate(username: str) -> None:
+    """
+    사용자 캐시 무효화 (존재하지 않음 기록 포함)
+
+    Args:
+        username: AWS Cognito User ID
+    """
+    async with _lock:
+        _cache.pop(username, None)
+        _missing.pop(username, None)
@@ -4,9 +4,10 @@
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import Select, select, update, delete, func, and_, or_
 from sqlalchemy.orm import selectinload
 from app.database.base import Base
+import uuid
 
 # 제네릭 타입 변수
 ModelType = TypeVar("ModelType", bound=Base)
@@ -30,9 +31,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    def _select(self) -> Select:
+        """
+        목록 조회용 기본 SELECT 문
+        - 하위 클래스에서 로딩 옵션(load_only 등)을 지정할 때 재정의
+        """
+        return select(self.model)
+
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """
         ID로 단일 객체 조회
+        - 기본 키 조회(db.get) 사용: 세션에 이미 로드된 객체면 쿼리 없이 반환
         
         Args:
             db: 데이터베이스 세션
@@ -41,8 +50,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             조회된 객체 또는 None
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
+        # identity map 키와 일치하도록 문자열 ID를 UUID로 변환
+        if isinstance(id, str):
+            try:
+                id = uuid.UUID(id)
+            except ValueError:
+                return None
+        
+        return await db.get(self.model, id)
 
     async def get_multi(
         self, 
@@ -66,7 +81,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             조회된 객체 리스트
         """
-        query = select(self.model)
+        query = self._select()
         
         # 필터 적용
         if filters:
@@ -241,7 +256,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             검색 결과 리스트
         """
-        search_query = select(self.model)
+        search_query = self._select()
         
         # 검색 조건 생성
         search_conditions = []
@@ -3,7 +3,7 @@
 
 from typing import Optional, List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_, desc, bindparam
 from sqlalchemy.orm import selectinload
 from app.crud.base import CRUDBase
 from app.models.library_item import LibraryItem, ItemType, VisibilityType
@@ -260,6 +260,59 @@ class CRUDLibraryItem(CRUDBase[LibraryItem, LibraryItemCreate, LibraryItemUpdate
         result = await db.execute(search_query)
         return result.scalars().all()
 
+    @staticmethod
+    def stats_columns() -> tuple:
+        """
+        타입별 통계 집계 컬럼 (get_user_stats, user_crud.get_user_with_stats 공용)
+        - 아이템 수, 파일 크기 합계, 최근 7일 업로드 수(FILTER 집계)
+        - 호출 측에서 LibraryItem.type으로 GROUP BY 해야 함
+        """
+        from datetime import datetime, timedelta, timezone
+        recent_date = datetime.now(timezone.utc) - timedelta(days=7)
+        
+        return (
+            LibraryItem.type,
+            func.count(LibraryItem.id).label('count'),
+            func.coalesce(func.sum(LibraryItem.file_size), 0).label('file_size'),
+            func.count(LibraryItem.id).filter(
+                # 이름 있는 바인드 파라미터: SQL 문자열이 고정되어 실행 계획 재사용
+                LibraryItem.created_at >= bindparam(
+                    'recent_since', recent_date, type_=LibraryItem.created_at.type
+                )
+            ).label('recent')
+        )
+
+    @staticmethod
+    def summarize_stats(rows) -> Dict[str, Any]:
+        """
+        stats_columns()로 조회한 타입별 행을 합산하여 전체 통계 계산
+        - type이 None인 행(외부 조인으로 아이템이 없는 경우)은 제외
+        
+        Args:
+            rows: 타입별 집계 행
+            
+        Returns:
+            통계 정보 딕셔너리
+        """
+        type_stats = {}
+        total_items = 0
+        total_file_size = 0
+        recent_uploads = 0
+        for row in rows:
+            if row.type is None:
+                continue
+            type_stats[row.type.value] = row.count
+            total_items += row.count
+            total_file_size += int(row.file_size)
+            recent_uploads += row.recent
+        
+        return {
+            "total_items": total_items,
+            "total_file_size": total_file_size,
+            "items_by_type": type_stats,
+            "recent_uploads": recent_uploads
+        }
+
     async def get_user_stats(
         self,
         db: AsyncSession,
@@ -276,55 +329,16 @@ class CRUDLibraryItem(CRUDBase[LibraryItem, LibraryItemCreate, LibraryItemUpdate
         Returns:
             통계 정보 딕셔너리
         """
-        # 전체 아이템 수 및 파일 크기
-        stats_query = select(
-            func.count(LibraryItem.id).label('total_items'),
-            func.sum(LibraryItem.file_size).label('total_file_size')
-        ).where(
-            and_(
-                LibraryItem.user_profile_id == user_id,
-                LibraryItem.deleted_at.is_(None)
-            )
-        )
-        
-        stats_result = await db.execute(stats_query)
-        stats = stats_result.first()
-        
-        # 타입별 아이템 수
-        type_stats_query = select(
-            LibraryItem.type,
-            func.count(LibraryItem.id).label('count')
-        ).where(
+        # 타입별 아이템 수/파일 크기/최근 7일 업로드 수를 한 번의 쿼리로 조회
+        stats_query = select(*self.stats_columns()).where(
             and_(
                 LibraryItem.user_profile_id == user_id,
                 LibraryItem.deleted_at.is_(None)
             )
         ).group_by(LibraryItem.type)
         
-        type_stats_result = await db.execute(type_stats_query)
-        type_stats = {row.type.value: row.count for row in type_stats_result}
-        
-        # 최근 7일 업로드 수
-        from datetime import datetime, timedelta
-        recent_date = datetime.utcnow() - timedelta(days=7)
-        
-        recent_query = select(func.count(LibraryItem.id)).where(
-            and_(
-                LibraryItem.user_profile_id == user_id,
-                LibraryItem.created_at >= recent_date,
-                LibraryItem.deleted_at.is_(None)
-            )
-        )
-        
-        recent_result = await db.execute(recent_query)
-        recent_uploads = recent_result.scalar()
-        
-        return {
-            "total_items": stats.total_items or 0,
-            "total_file_size": stats.total_file_size or 0,
-            "items_by_type": type_stats,
-            "recent_uploads": recent_uploads or 0
-        }
+        stats_result = await db.execute(stats_query)
+        return self.summarize_stats(stats_result)
 
     async def get_items_by_date_range(
         self,
@@ -3,13 +3,39 @@
 
 from typing import Optional, List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, select, func, and_, literal, lambda_stmt, bindparam
+from sqlalchemy.orm import selectinload, make_transient_to_detached, load_only
+from sqlalchemy.exc import IntegrityError
+from app.core import user_cache
 from app.crud.base import CRUDBase
+from app.crud.library_item import library_item_crud
 from app.models.user import User
 from app.models.library_item import LibraryItem
 from app.schemas.user import UserCreate, UserUpdate
 
+# 자주 실행되는 조회 쿼리 (lambda_stmt로 SQL 컴파일 결과를 캐시하여 재사용)
+_GET_BY_USERNAME = lambda_stmt(
+    lambda: select(User).where(User.username == bindparam("username"))
+)
+# 닉네임은 대소문자 무시 비교 (ix_users_nickname_lower 유니크 함수 인덱스 사용)
+_GET_BY_NICKNAME = lambda_stmt(
+    lambda: select(User).where(
+        func.lower(User.nickname) == func.lower(bindparam("nickname"))
+    )
+)
+_USERNAME_EXISTS = lambda_stmt(
+    lambda: select(literal(1)).where(User.username == bindparam("username")).limit(1)
+)
+_NICKNAME_EXISTS = lambda_stmt(
+    lambda: select(literal(1)).where(
+        func.lower(User.nickname) == func.lower(bindparam("nickname"))
+    )
+)
+
+# 사용자 목록/검색 응답(UserResponse)에 필요한 컬럼
+# - 이외 컬럼은 로드하지 않고, 접근 시 추가 쿼리 대신 예외 발생
+USER_LIST_COLUMNS = (User.id, User.username, User.nickname, User.created_at, User.updated_at)
+
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """
@@ -17,9 +43,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     - 사용자 관련 데이터베이스 작업 수행
     """
 
+    def _select(self) -> Select:
+        """목록 조회용 SELECT 문 (응답에 필요한 컬럼만 로드)"""
+        return select(User).options(load_only(*USER_LIST_COLUMNS, raiseload=True))
+
     async def get_by_username(self, db: AsyncSession, *, username: str) -> Optional[User]:
         """
         Cognito User ID(username)로 사용자 조회
+        - user_cache에 컬럼 값이 있으면 DB 조회 없이 세션에 병합하여 반환
+        - 최근 조회에서 없던 사용자는 DB 조회 없이 None 반환
         
         Args:
             db: 데이터베이스 세션
@@ -28,14 +60,33 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             조회된 사용자 또는 None
         """
-        result = await db.execute(
-            select(User).where(User.username == username)
-        )
-        return result.scalar_one_or_none()
+        fields = await user_cache.get_user_fields(username)
+        if fields is not None:
+            # 캐시 히트: 분리(detached) 상태 객체를 만들어 쿼리 없이 세션에 병합
+            cached_user = User(**fields)
+            make_transient_to_detached(cached_user)
+            return await db.merge(cached_user, load=False)
+        
+        if await user_cache.is_missing(username):
+            return None
+        
+        result = await db.execute(_GET_BY_USERNAME, {"username": username})
+        user = result.scalar_one_or_none()
+        
+        if user:
+            await user_cache.cache_user_fields(username, self._cache_fields(user))
+        else:
+            await user_cache.cache_missing(username)
+        return user
+
+    @staticmethod
+    def _cache_fields(user: User) -> Dict[str, Any]:
+        """캐시에 저장할 사용자 컬럼 값 추출"""
+        return {key: getattr(user, key) for key in User.__table__.columns.keys()}
 
     async def get_by_nickname(self, db: AsyncSession, *, nickname: str) -> Optional[User]:
         """
-        닉네임으로 사용자 조회
+        닉네임으로 사용자 조회 (대소문자 무시)
         
         Args:
             db: 데이터베이스 세션
@@ -44,9 +95,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             조회된 사용자 또는 None
         """
-        result = await db.execute(
-            select(User).where(User.nickname == nickname)
-        )
+        result = await db.execute(_GET_BY_NICKNAME, {"nickname": nickname})
         return result.scalar_one_or_none()
 
     async def create_user(self, db: AsyncSession, *, user_in: UserCreate) -> User:
@@ -63,16 +112,21 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Raises:
             ValueError: 이미 존재하는 username 또는 nickname인 경우
         """
-        # 중복 확인
-        existing_user = await self.get_by_username(db, username=user_in.username)
-        if existing_user:
+        # 중복 확인 (user_cache를 거치지 않고 DB에서 직접 확인)
+        if not await self.is_username_available(db, username=user_in.username):
             raise ValueError(f"이미 존재하는 사용자입니다: {user_in.username}")
         
-        existing_nickname = await self.get_by_nickname(db, nickname=user_in.nickname)
-        if existing_nickname:
+        if not await self.is_nickname_available(db, nickname=user_in.nickname):
             raise ValueError(f"이미 사용 중인 닉네임입니다: {user_in.nickname}")
         
-        return await self.create(db, obj_in=user_in)
+        try:
+            user = await self.create(db, obj_in=user_in)
+        except IntegrityError:
+            # 동시 가입으로 위 확인을 함께 통과한 경우 유니크 인덱스에서 거부됨
+            await db.rollback()
+            raise ValueError(f"이미 존재하는 사용자 또는 닉네임입니다: {user_in.nickname}")
+        await user_cache.invalidate(user.username)
+        return user
 
     async def update_user(
         self, 
@@ -101,11 +155,19 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         
         # 닉네임 중복 확인 (자신 제외)
         if user_in.nickname and user_in.nickname != user.nickname:
-            existing_nickname = await self.get_by_nickname(db, nickname=user_in.nickname)
-            if existing_nickname and existing_nickname.id != user.id:
+            if not await self.is_nickname_available(
+                db, nickname=user_in.nickname, exclude_user_id=str(user.id)
+            ):
                 raise ValueError(f"이미 사용 중인 닉네임입니다: {user_in.nickname}")
         
-        return await self.update(db, db_obj=user, obj_in=user_in)
+        try:
+            updated_user = await self.update(db, db_obj=user, obj_in=user_in)
+        except IntegrityError:
+            # 동시 수정으로 위 확인을 함께 통과한 경우 유니크 인덱스에서 거부됨
+            await db.rollback()
+            raise ValueError(f"이미 사용 중인 닉네임입니다: {user_in.nickname}")
+        await user_cache.invalidate(updated_user.username)
+        return updated_user
 
     async def get_user_with_stats(self, db: AsyncSession, *, user_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -118,61 +180,27 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             사용자 정보와 통계 딕셔너리
         """
-        user = await self.get(db, id=user_id)
-        if not user:
-            return None
-        
-        # 라이브러리 아이템 통계 조회
+        # 사용자 조회 + 타입별 통계를 한 번의 쿼리로 처리
+        # - 삭제되지 않은 아이템만 조인 (아이템이 없어도 사용자 행 1개 반환)
+        # - 집계 컬럼/합산은 library_item_crud와 공용
         stats_query = select(
-            func.count(LibraryItem.id).label('total_items'),
-            func.sum(LibraryItem.file_size).label('total_file_size')
-        ).where(
+            User,
+            *library_item_crud.stats_columns()
+        ).outerjoin(
+            LibraryItem,
             and_(
-                LibraryItem.user_profile_id == user_id,
+                LibraryItem.user_profile_id == User.id,
                 LibraryItem.deleted_at.is_(None)  # 삭제되지 않은 아이템만
             )
-        )
+        ).where(User.id == user_id).group_by(User.id, LibraryItem.type)
         
-        stats_result = await db.execute(stats_query)
-        stats = stats_result.first()
-        
-        # 타입별 아이템 수 조회
-        type_stats_query = select(
-            LibraryItem.type,
-            func.count(LibraryItem.id).label('count')
-        ).where(
-            and_(
-                LibraryItem.user_profile_id == user_id,
-                LibraryItem.deleted_at.is_(None)
-            )
-        ).group_by(LibraryItem.type)
-        
-        type_stats_result = await db.execute(type_stats_query)
-        type_stats = {row.type.value: row.count for row in type_stats_result}
-        
-        # 최근 7일 업로드 수 조회
-        from datetime import datetime, timedelta
-        recent_date = datetime.utcnow() - timedelta(days=7)
-        
-        recent_query = select(func.count(LibraryItem.id)).where(
-            and_(
-                LibraryItem.user_profile_id == user_id,
-                LibraryItem.created_at >= recent_date,
-                LibraryItem.deleted_at.is_(None)
-            )
-        )
-        
-        recent_result = await db.execute(recent_query)
-        recent_uploads = recent_result.scalar()
+        rows = (await db.execute(stats_query)).all()
+        if not rows:
+            return None
         
         return {
-            "user": user,
-            "stats": {
-                "total_items": stats.total_items or 0,
-                "total_file_size": stats.total_file_size or 0,
-                "items_by_type": type_stats,
-                "recent_uploads": recent_uploads or 0
-            }
+            "user": rows[0].User,
+            "stats": library_item_crud.summarize_stats(rows)
         }
 
     async def search_users(
@@ -195,13 +223,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             검색된 사용자 리스트
         """
-        return await self.search(
-            db,
-            query=query,
-            search_fields=["nickname"],
-            skip=skip,
-            limit=limit
-        )
+        # 부분 일치 검색은 pg_trgm GIN 인덱스(ix_users_nickname_trgm)로 처리
+        # 유사도가 높은 닉네임부터 정렬
+        search_query = self._select().where(
+            User.nickname.ilike(f"%{query}%")
+        ).order_by(
+            func.similarity(User.nickname, query).desc(),
+            User.created_at.desc()
+        ).offset(skip).limit(limit)
+        
+        result = await db.execute(search_query)
+        return result.scalars().all()
 
     async def get_users_by_date_range(
         self,
@@ -253,12 +285,13 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             사용 가능하면 True, 이미 사용 중이면 False
         """
-        existing_user = await self.get_by_username(db, username=username)
-        return existing_user is None
+        # ORM 객체를 만들지 않고 존재 여부만 확인 (인덱스에서 첫 매치 시 종료)
+        result = await db.execute(_USERNAME_EXISTS, {"username": username})
+        return result.scalar() is None
 
     async def is_nickname_available(self, db: AsyncSession, *, nickname: str, exclude_user_id: Optional[str] = None) -> bool:
         """
-        닉네임 사용 가능 여부 확인
+        닉네임 사용 가능 여부 확인 (대소문자 무시)
         
         Args:
             db: 데이터베이스 세션
@@ -268,14 +301,16 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             사용 가능하면 True, 이미 사용 중이면 False
         """
-        query = select(User).where(User.nickname == nickname)
+        query = _NICKNAME_EXISTS
+        params = {"nickname": nickname}
         
         if exclude_user_id:
-            query = query.where(User.id != exclude_user_id)
+            query += lambda s: s.where(User.id != bindparam("exclude_user_id"))
+            params["exclude_user_id"] = exclude_user_id
         
-        result = await db.execute(query)
-        existing_user = result.scalar_one_or_none()
-        return existing_user is None
+        query += lambda s: s.limit(1)
+        result = await db.execute(query, params)
+        return result.scalar() is None
 
 
 # 전역 CRUD 인스턴스
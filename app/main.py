@@ -3,11 +3,12 @@
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.database.base import test_connection, close_db_connections
+from app.services.s3_service import s3_service
 from app.schemas.common import HealthCheckResponse, ErrorResponse
 from datetime import datetime
 import logging
@@ -52,6 +53,25 @@ async def create_tables():
         raise
 
 
+def log_settings():
+    """개발 환경에서만 설정 정보 출력 (워커 시작 시 1회)"""
+    if not settings.DEBUG or not logger.isEnabledFor(logging.INFO):
+        return
+    
+    logger.info("🔧 애플리케이션 설정 로드 완료")
+    logger.info(f"📊 데이터베이스: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+    logger.info(f"🌐 서버: {settings.HOST}:{settings.PORT}")
+    logger.info(f"🔐 JWT 알고리즘: {settings.JWT_ALGORITHM}")
+    logger.info(f"☁️ AWS 리전: {settings.AWS_REGION}")
+    logger.info(f"🪣 S3 버킷: {settings.S3_BUCKET_NAME}")
+    
+    # AWS 키가 설정되었는지 확인
+    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+        logger.info("✅ AWS 자격 증명 설정됨")
+    else:
+        logger.info("⚠️ AWS 자격 증명이 설정되지 않음 - 개발 모드로 실행")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -61,6 +81,7 @@ async def lifespan(app: FastAPI):
     """
     # 시작 시 실행
     logger.info("🚀 FastAPI 애플리케이션 시작")
+    log_settings()
     
     # 데이터베이스 연결 테스트
     db_connected = await test_connection()
@@ -71,6 +92,9 @@ async def lifespan(app: FastAPI):
     # SQLAlchemy로 테이블 자동 생성
     await create_tables()
     
+    # S3 클라이언트 생성 및 연결 예열
+    await s3_service.warm_up()
+    
     logger.info("✅ 애플리케이션 초기화 완료")
     
     yield
@@ -89,6 +113,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    default_response_class=ORJSONResponse,  # datetime/UUID를 orjson으로 직렬화
     lifespan=lifespan
 )
 
@@ -10,6 +10,9 @@ from app.core.config import settings
 import uuid
 import enum
 
+# S3 객체 URL 공통 접두사 (모듈 로드 시 한 번만 생성)
+_S3_URL_PREFIX = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.S3_REGION}.amazonaws.com/"
+
 
 class ItemType(enum.Enum):
     """라이브러리 아이템 타입 열거형"""
@@ -162,13 +165,13 @@ class LibraryItem(Base):
     def file_url(self):
         """S3 파일 URL 생성 (실제로는 S3 클라이언트에서 presigned URL 생성)"""
         # 실제 구현에서는 S3 클라이언트를 사용해 presigned URL 생성
-        return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.S3_REGION}.amazonaws.com/{self.s3_key}"
+        return _S3_URL_PREFIX + self.s3_key
 
     @property
     def thumbnail_url(self):
         """S3 썸네일 URL 생성"""
         if self.s3_thumbnail_key:
-            return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.S3_REGION}.amazonaws.com/{self.s3_thumbnail_key}"
+            return _S3_URL_PREFIX + self.s3_thumbnail_key
         return None
 
     def soft_delete(self):
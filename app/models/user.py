@@ -1,11 +1,12 @@
 # 📁 새로 생성된 파일: app/models/user.py
 # 사용자 테이블 SQLAlchemy 모델
 
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index, DDL, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.models_config import Base
+from datetime import datetime, timezone
 import uuid
 
 
@@ -16,6 +17,21 @@ class User(Base):
     - users 테이블: id(uuid), username(uuid/cognito_id), nickname(text), created_at, updated_at
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # 닉네임 부분 일치 검색용 트라이그램 인덱스 (pg_trgm 확장 필요)
+        Index(
+            "ix_users_nickname_trgm", "nickname",
+            postgresql_using="gin",
+            postgresql_ops={"nickname": "gin_trgm_ops"}
+        ),
+        # 닉네임 유니크 인덱스 (대소문자 무시: "Alice"와 "alice"는 같은 닉네임)
+        Index("ix_users_nickname_lower", func.lower(text("nickname")), unique=True),
+        # 사용자 목록(created_at 역순) 조회용 커버링 인덱스 (index-only scan)
+        Index(
+            "ix_users_list_cover", "created_at",
+            postgresql_include=["id", "username", "nickname", "updated_at"]
+        ),
+    )
 
     # Primary Key: UUID 타입
     id = Column(
@@ -42,8 +58,11 @@ class User(Base):
     )
     
     # 생성 시간 (자동 설정)
+    # - 클라이언트 측 기본값: 일괄 INSERT 시 행마다 DB now()를 계산하지 않음
+    # - server_default는 ORM 외부 INSERT를 위해 유지
     created_at = Column(
         DateTime(timezone=True), 
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
         comment="계정 생성 시간"
@@ -52,6 +71,7 @@ class User(Base):
     # 수정 시간 (자동 업데이트)
     updated_at = Column(
         DateTime(timezone=True), 
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
@@ -59,11 +79,14 @@ class User(Base):
     )
 
     # 관계 설정: 사용자가 소유한 라이브러리 아이템들
+    # - 암묵적 지연 로딩(N+1) 방지: 필요한 쿼리에서 selectinload(User.library_items)로 명시적으로 로드
+    # - 개수만 필요하면 관계 대신 library_item_crud.count_user_items 사용
     library_items = relationship(
         "LibraryItem", 
         back_populates="user",
         cascade="all, delete-orphan",  # 사용자 삭제 시 관련 아이템도 삭제
-        lazy="dynamic"  # 필요할 때만 로드
+        passive_deletes=True,  # 아이템을 로드하지 않고 DB의 ON DELETE CASCADE로 삭제
+        lazy="raise"
     )
 
     def __repr__(self):
@@ -80,14 +103,37 @@ class User(Base):
         """
         return self.username
 
+    def to_dict_raw(self):
+        """
+        모델을 딕셔너리로 변환 (원본 타입 유지)
+        - UUID/datetime을 변환하지 않음 (orjson 응답 경로에서 직접 직렬화)
+        """
+        return {
+            "id": self.id,
+            "username": self.username,
+            "nickname": self.nickname,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
     def to_dict(self):
         """
-        모델을 딕셔너리로 변환 (API 응답용)
+        모델을 딕셔너리로 변환 (datetime은 ISO 문자열로 변환)
+        - id는 UUID 그대로 반환 (orjson/msgspec이 문자열로 직렬화)
+        - 문자열이 꼭 필요하면 self.id.hex 사용 (하이픈 없는 형식)
         """
         return {
-            "id": str(self.id),
+            "id": self.id,
             "username": self.username,
             "nickname": self.nickname,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        }
+
+
+# create_all로 테이블 생성 시 트라이그램 인덱스보다 pg_trgm 확장이 먼저 필요
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
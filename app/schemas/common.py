@@ -16,11 +16,6 @@ class BaseResponse(BaseModel):
     """
     success: bool = Field(description="요청 성공 여부")
     message: Optional[str] = Field(None, description="응답 메시지")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ErrorResponse(BaseResponse):
@@ -102,9 +97,4 @@ class HealthCheckResponse(BaseModel):
     status: str = Field("healthy", description="서비스 상태")
     timestamp: datetime = Field(description="응답 시간")
     version: str = Field(description="API 버전")
-    database: str = Field(description="데이터베이스 연결 상태")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    database: str = Field(description="데이터베이스 연결 상태")
\ No newline at end of file
@@ -1,8 +1,8 @@
 # 📁 새로 생성된 파일: app/schemas/library_item.py
 # 라이브러리 아이템 관련 Pydantic 스키마
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter, validator
+from typing import List, Optional
 from datetime import datetime
 import uuid
 from enum import Enum
@@ -135,11 +135,7 @@ class LibraryItemResponse(LibraryItemBase):
     deleted_at: Optional[datetime] = Field(None, description="삭제 시간")
     
     class Config:
-        from_attributes = True  # SQLAlchemy 모델에서 자동 변환
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            uuid.UUID: lambda v: str(v)
-        }
+        from_attributes = True  # SQLAlchemy 모델에서 자동 변환 (datetime/UUID 직렬화는 orjson이 처리)
         schema_extra = {
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -163,6 +159,10 @@ class LibraryItemResponse(LibraryItemBase):
         }
 
 
+# ORM 객체 리스트를 응답 스키마 리스트로 일괄 변환 (pydantic-core에서 한 번에 검증)
+LibraryItemResponseList = TypeAdapter(List[LibraryItemResponse])
+
+
 class LibraryItemInDB(LibraryItemResponse):
     """
     데이터베이스 내부 라이브러리 아이템 스키마
@@ -1,10 +1,18 @@
 # 📁 새로 생성된 파일: app/schemas/user.py
 # 사용자 관련 Pydantic 스키마
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional, TYPE_CHECKING
 from datetime import datetime
 import uuid
+import msgspec
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+# 공백 제거 후 길이 검증 (pydantic-core에서 처리, Python validator 호출 없음)
+Nickname = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+CognitoUsername = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class UserBase(BaseModel):
@@ -12,14 +20,7 @@ class UserBase(BaseModel):
     사용자 기본 스키마
     - 공통 필드 정의
     """
-    nickname: str = Field(..., min_length=1, max_length=100, description="사용자 닉네임")
-    
-    @validator('nickname')
-    def validate_nickname(cls, v):
-        """닉네임 검증"""
-        if not v or not v.strip():
-            raise ValueError('닉네임은 필수입니다')
-        return v.strip()
+    nickname: Nickname = Field(..., description="사용자 닉네임")
 
 
 class UserCreate(UserBase):
@@ -27,14 +28,7 @@ class UserCreate(UserBase):
     사용자 생성 요청 스키마
     - 회원가입 시 사용
     """
-    username: str = Field(..., description="AWS Cognito User ID")
-    
-    @validator('username')
-    def validate_username(cls, v):
-        """Cognito User ID 검증"""
-        if not v or not v.strip():
-            raise ValueError('Cognito User ID는 필수입니다')
-        return v.strip()
+    username: CognitoUsername = Field(..., description="AWS Cognito User ID")
     
     class Config:
         schema_extra = {
@@ -50,14 +44,7 @@ class UserUpdate(BaseModel):
     사용자 정보 수정 요청 스키마
     - 프로필 수정 시 사용
     """
-    nickname: Optional[str] = Field(None, min_length=1, max_length=100, description="사용자 닉네임")
-    
-    @validator('nickname')
-    def validate_nickname(cls, v):
-        """닉네임 검증"""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('닉네임은 비어있을 수 없습니다')
-        return v.strip() if v else v
+    nickname: Optional[Nickname] = Field(None, description="사용자 닉네임")
     
     class Config:
         schema_extra = {
@@ -78,11 +65,7 @@ class UserResponse(UserBase):
     updated_at: datetime = Field(description="마지막 수정 시간")
     
     class Config:
-        from_attributes = True  # SQLAlchemy 모델에서 자동 변환
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            uuid.UUID: lambda v: str(v)
-        }
+        from_attributes = True  # SQLAlchemy 모델에서 자동 변환 (datetime/UUID 직렬화는 orjson이 처리)
         schema_extra = {
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -94,6 +77,34 @@ class UserResponse(UserBase):
         }
 
 
+def user_to_response(user: "User") -> UserResponse:
+    """
+    DB에서 조회한 사용자를 응답 스키마로 변환
+    - DB 값은 저장 시 이미 검증되었으므로 model_construct로 검증(닉네임 공백 제거/길이 검증 포함)을 생략
+    - 외부 입력(UserCreate/UserUpdate)에는 사용하지 말 것
+    
+    Args:
+        user: 사용자 모델 객체
+        
+    Returns:
+        사용자 응답 스키마
+    """
+    return UserResponse.model_construct(**user.to_dict_raw())
+
+
+class UserResponseStruct(msgspec.Struct):
+    """
+    사용자 정보 응답 구조체 (목록 응답 전용)
+    - UserResponse와 같은 필드를 msgspec으로 직접 인코딩
+    - 행마다 Pydantic 모델을 생성하지 않기 위해 사용
+    """
+    id: uuid.UUID
+    username: str
+    nickname: str
+    created_at: datetime
+    updated_at: datetime
+
+
 class UserInDB(UserResponse):
     """
     데이터베이스 내부 사용자 스키마
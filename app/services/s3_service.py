@@ -3,8 +3,13 @@
 
 import boto3
 from botocore.config import Config
+import asyncio
+import functools
+import os
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from botocore.exceptions import ClientError, NoCredentialsError
 from app.core.config import settings
@@ -12,6 +17,39 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 공통 botocore 설정
+# - 커넥션 풀 확대 (기본 10개): 스레드 풀에서 동시에 실행되는 S3 호출이 풀 대기로 직렬화되지 않도록 함
+# - TCP keepalive로 유휴 연결 유지, adaptive 재시도로 스로틀링 시 백오프
+_BOTO_CFG = Config(
+    s3={"addressing_style": "virtual"},
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "total_max_attempts": 3},  # 최초 요청 포함 최대 3회
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+)
+
+# 시작 시 S3 연결 예열 대기 상한 (초) - S3에 연결할 수 없어도 재시도 때문에 시작이 지연되지 않도록 함
+WARM_UP_TIMEOUT = 3
+
+# 자주 사용되는 MIME 타입 (집합 조회로 빠르게 판별, 그 외는 접두사로 확인)
+_IMAGE_TYPES = frozenset({
+    "image/jpeg", "image/png", "image/webp", "image/gif", "image/avif", "image/heic"
+})
+_VIDEO_TYPES = frozenset({"video/mp4", "video/webm", "video/quicktime"})
+
+
+@functools.lru_cache(maxsize=1)
+def _month_prefix(minute_bucket: int) -> str:
+    """
+    S3 키의 "uploads/yyyy/mm/" 접두사 (분 단위로 캐시)
+    
+    Args:
+        minute_bucket: Unix 시간 // 60
+    """
+    now = datetime.fromtimestamp(minute_bucket * 60, tz=timezone.utc)
+    return f"uploads/{now.year}/{now.month:02d}/"
+
 
 class S3Service:
     """
@@ -22,27 +60,79 @@ class S3Service:
     """
     
     def __init__(self):
-        """S3 클라이언트 초기화"""
+        """
+        S3 서비스 초기화
+        - boto3 클라이언트는 import 시점이 아니라 첫 사용 시(또는 warm_up) 생성
+        """
+        self.bucket_name = settings.S3_BUCKET_NAME
+        # 개발 모드 더미 URL 접두사 (요청마다 포맷하지 않도록 미리 계산)
+        self._mock_host = f"https://{self.bucket_name}.s3.amazonaws.com/"
+        self._s3_client = None
+        self._client_initialized = False
+        # 예열 스레드와 요청 처리 중 동시 접근 시 클라이언트를 한 번만 생성
+        self._client_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """S3 클라이언트 (첫 접근 시 생성, 실패하면 None → 개발 모드)"""
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._s3_client = self._create_client()
+                    self._client_initialized = True
+        return self._s3_client
+
+    def _create_client(self):
+        """S3 클라이언트 생성"""
         try:
             endpoint_url = f"https://s3.{settings.S3_REGION}.amazonaws.com"
-            self.s3_client = boto3.client(
+            client = boto3.client(
                 "s3",
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
                 region_name=settings.S3_REGION,
                 endpoint_url=endpoint_url,
-                config=Config(s3={"addressing_style": "virtual"}),
+                config=_BOTO_CFG,
             )
-            self.bucket_name = settings.S3_BUCKET_NAME
             logger.info("✅ S3 클라이언트 초기화 완료")
+            return client
         except NoCredentialsError:
             logger.warning("⚠️ AWS 자격 증명이 설정되지 않음 - 개발 모드로 실행")
-            self.s3_client = None
-            self.bucket_name = settings.S3_BUCKET_NAME
+            return None
         except Exception as e:
             logger.error(f"❌ S3 클라이언트 초기화 실패: {e}")
-            self.s3_client = None
-            self.bucket_name = settings.S3_BUCKET_NAME
+            return None
+
+    def _warm_up_sync(self) -> None:
+        """클라이언트 생성 후 head_bucket 1회 호출 (자격 증명 확인 + 커넥션 풀에 TLS 연결 확보)"""
+        client = self.s3_client
+        if not client:
+            return
+        
+        try:
+            client.head_bucket(Bucket=self.bucket_name)
+            logger.info("✅ S3 연결 예열 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ S3 연결 예열 실패 (요청 시 재시도): {e}")
+
+    async def warm_up(self) -> None:
+        """
+        S3 클라이언트 예열 (애플리케이션 시작 시 워커마다 1회)
+        - 첫 요청이 클라이언트 생성/TLS 핸드셰이크 비용을 부담하지 않도록 함
+        - WARM_UP_TIMEOUT 이내에 끝나지 않으면 기다리지 않고 시작 진행 (예열은 백그라운드에서 계속)
+        """
+        try:
+            await asyncio.wait_for(self._run_sync(self._warm_up_sync), timeout=WARM_UP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ S3 연결 예열 시간 초과 - 예열을 기다리지 않고 시작")
+
+    async def _run_sync(self, func, *args, **kwargs):
+        """
+        동기 boto3 호출을 기본 스레드 풀에서 실행
+        - 이벤트 루프 블로킹 방지 및 asyncio.gather 병렬 실행 지원
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
     def generate_s3_key(self, filename: str, user_id: str) -> str:
         """
@@ -53,14 +143,13 @@ class S3Service:
             user_id: 사용자 ID
             
         Returns:
-            S3 키 (예: uploads/2024/12/user123/uuid-filename.jpg)
+            S3 키 (예: uploads/2024/12/user123/uuidhex.jpg)
         """
-        now = datetime.utcnow()
-        file_extension = filename.split('.')[-1] if '.' in filename else ''
-        unique_filename = f"{uuid.uuid4()}.{file_extension}" if file_extension else str(uuid.uuid4())
+        prefix = _month_prefix(int(time.time()) // 60)
+        _, file_extension = os.path.splitext(filename)
         
-        s3_key = f"uploads/{now.year}/{now.month:02d}/{user_id}/{unique_filename}"
-        return s3_key
+        # file_extension은 점(.)을 포함 (예: ".jpg"), 없으면 빈 문자열
+        return "".join((prefix, user_id, "/", uuid.uuid4().hex, file_extension))
 
     def generate_thumbnail_key(self, s3_key: str) -> str:
         """
@@ -107,7 +196,7 @@ class S3Service:
             if not self.s3_client:
                 # 개발 환경에서 더미 URL 반환
                 return {
-                    "upload_url": f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}?mock=true",
+                    "upload_url": self._mock_host + s3_key + "?mock=true",
                     "s3_key": s3_key,
                     "expires_in": expires_in,
                     "fields": {},
@@ -115,7 +204,9 @@ class S3Service:
                 }
             
             # Presigned POST URL 생성 (더 안전함)
-            response = self.s3_client.generate_presigned_post(
+            # 서명 계산은 동기 호출이므로 스레드 풀에서 실행
+            response = await self._run_sync(
+                self.s3_client.generate_presigned_post,
                 Bucket=self.bucket_name,
                 Key=s3_key,
                 Fields={
@@ -167,9 +258,10 @@ class S3Service:
         try:
             if not self.s3_client:
                 # 개발 환경에서 더미 URL 반환
-                return f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}?mock=true"
+                return self._mock_host + s3_key + "?mock=true"
             
-            url = self.s3_client.generate_presigned_url(
+            url = await self._run_sync(
+                self.s3_client.generate_presigned_url,
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expires_in
@@ -196,7 +288,9 @@ class S3Service:
                 logger.info(f"개발 모드: 파일 삭제 시뮬레이션 - {s3_key}")
                 return True
             
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            await self._run_sync(
+                self.s3_client.delete_object, Bucket=self.bucket_name, Key=s3_key
+            )
             logger.info(f"S3 파일 삭제 완료: {s3_key}")
             return True
             
@@ -221,7 +315,8 @@ class S3Service:
                 return True
             
             copy_source = {'Bucket': self.bucket_name, 'Key': source_key}
-            self.s3_client.copy_object(
+            await self._run_sync(
+                self.s3_client.copy_object,
                 CopySource=copy_source,
                 Bucket=self.bucket_name,
                 Key=dest_key
@@ -268,17 +363,24 @@ class S3Service:
             logger.error(f"S3 파일 정보 조회 실패: {e}")
             return None
 
-    def is_image_file(self, content_type: str) -> bool:
+    @staticmethod
+    def is_image_file(content_type: str) -> bool:
         """이미지 파일 여부 확인"""
-        return content_type.startswith('image/')
+        return content_type in _IMAGE_TYPES or content_type.startswith('image/')
 
-    def is_video_file(self, content_type: str) -> bool:
+    @staticmethod
+    def is_video_file(content_type: str) -> bool:
         """비디오 파일 여부 확인"""
-        return content_type.startswith('video/')
+        return content_type in _VIDEO_TYPES or content_type.startswith('video/')
 
-    def needs_thumbnail(self, content_type: str) -> bool:
+    @staticmethod
+    def needs_thumbnail(content_type: str) -> bool:
         """썸네일 생성이 필요한 파일 타입인지 확인"""
-        return self.is_image_file(content_type) or self.is_video_file(content_type)
+        return (
+            content_type in _IMAGE_TYPES
+            or content_type in _VIDEO_TYPES
+            or content_type.startswith(('image/', 'video/'))
+        )
 
 
 # 전역 S3 서비스 인스턴스